@@ -3,6 +3,7 @@ import { useNavigate } from 'react-router-dom';
 import { useOffices, useServices, useTokens, useCounters, useMetrics } from '@/hooks/useQueueData';
 import { useUserRole } from '@/hooks/useUserRole';
 import { useAuth } from '@/contexts/AuthContext';
+import type { Priority } from '@/types/database';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { Button } from '@/components/ui/button';
@@ -29,17 +30,17 @@ const AdminDashboard = () => {
 
   const activeCounters = counters.filter(c => c.is_active).length;
   const completedToday = allTokens.filter(t => t.status === 'COMPLETED').length;
-  const avgWait = waitingTokens.length > 0 
-    ? Math.round(waitingTokens.reduce((acc, t) => acc + (t.estimated_wait_minutes || 0), 0) / waitingTokens.length)
-    : 0;
 
-  // Priority breakdown
-  const priorityBreakdown = {
-    EMERGENCY: waitingTokens.filter(t => t.priority === 'EMERGENCY').length,
-    DISABLED: waitingTokens.filter(t => t.priority === 'DISABLED').length,
-    SENIOR: waitingTokens.filter(t => t.priority === 'SENIOR').length,
-    NORMAL: waitingTokens.filter(t => t.priority === 'NORMAL').length,
-  };
+  // Wait total and priority breakdown in a single pass over the waiting queue
+  const priorityBreakdown: Record<Priority, number> = { EMERGENCY: 0, DISABLED: 0, SENIOR: 0, NORMAL: 0 };
+  let totalWait = 0;
+
+  for (const t of waitingTokens) {
+    priorityBreakdown[t.priority]++;
+    totalWait += t.estimated_wait_minutes || 0;
+  }
+
+  const avgWait = waitingTokens.length > 0 ? Math.round(totalWait / waitingTokens.length) : 0;
 
   const handleSignOut = async () => {
     await signOut();